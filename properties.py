@@ -7,6 +7,58 @@ from bpy.types import Context
 # ==============================================================================
 # Description: Callback functions to handle value changes of properties
 
+# Mapping from class names to their index in the list of classes
+_name_to_index: dict[str, int] = {}
+
+
+def _ensure_index_map(cls_list: bpy.types.bpy_prop_collection) -> None:
+    '''
+    Rebuild the class name to index mapping if the list of classes has changed
+
+    The length and the first/last class names are used as a cheap signature of the list of classes
+
+    Args
+        cls_list: List of classes
+    '''
+    global _name_to_index
+
+    n = len(cls_list)
+    if n == len(_name_to_index) and (n == 0 or (_name_to_index.get(cls_list[0].name) == 0 and _name_to_index.get(cls_list[-1].name) == n-1)):
+        return
+
+    _name_to_index = {c.name: i for i, c in enumerate(cls_list)}
+
+
+def _resolve_index(bat: 'BAT_Properties', cls_list: bpy.types.bpy_prop_collection) -> int:
+    '''
+    Get the index of the current class in the list of classes
+
+    Args
+        bat: BAT properties of the scene
+        cls_list: List of classes of the BAT properties
+
+    Returns
+        Index of the current class (-1 if not found)
+    '''
+    global _name_to_index
+
+    _ensure_index_map(cls_list)
+    current_class = bat.current_class
+
+    idx = _name_to_index.get(current_class, -1)
+    if idx < 0 or cls_list[idx].name != current_class:
+        # The list of classes changed without changing the signature, rebuild the mapping
+        _name_to_index = {c.name: i for i, c in enumerate(cls_list)}
+        idx = _name_to_index.get(current_class, -1)
+    return idx
+
+
+# Items of the Current Class Enum and the class names they were built from
+# Blender requires the strings of dynamic enum items to be referenced from Python, so they are kept at module level
+_enum_items_cache: list[tuple[str,str,str]] = []
+_enum_items_signature: tuple[str,...] = ()
+
+
 def populate_classes(self, context: Context) -> list[tuple[str,str,str]]:
     '''
     Set items for "Current Class Enum" given the list of classes
@@ -17,15 +69,24 @@ def populate_classes(self, context: Context) -> list[tuple[str,str,str]]:
     Returns
         A list of items for the Current Class Enum
     '''
-    
-    enum_items = [] 
+    global _enum_items_cache, _enum_items_signature, _name_to_index
+
+    bat = context.scene.bat_properties
+    cls_list = bat.classification_classes
+
+    sig = tuple(c.name for c in cls_list)
+
+    # Reuse the items if the list of classes is unchanged
+    if sig == _enum_items_signature:
+        return _enum_items_cache
+
+    # The list of classes has changed, so the name to index mapping is rebuilt as well
+    _name_to_index = {n: i for i, n in enumerate(sig)}
 
-    for classification_class in context.scene.bat_properties.classification_classes:        
-        name = classification_class.name
-        item = (name, name, name)  # (ID, name, value)
-        enum_items.append(item)
-        
-    return enum_items
+    _enum_items_signature = sig
+    _enum_items_cache = [(n, n, n) for n in sig]  # (ID, name, value)
+
+    return _enum_items_cache
 
 
 def update_current_class_params(self, context: Context) -> None:
@@ -35,13 +96,17 @@ def update_current_class_params(self, context: Context) -> None:
     Args
         context: Current context
     '''
+    bat = context.scene.bat_properties
+    cls_list = bat.classification_classes
+
     # Get the index of current class
-    index = context.scene.bat_properties.classification_classes.find(context.scene.bat_properties.current_class)
+    index = _resolve_index(bat, cls_list)
 
     # Set current class params
-    context.scene.bat_properties.current_class_color = context.scene.bat_properties.classification_classes[index].mask_color
-    context.scene.bat_properties.current_class_objects = context.scene.bat_properties.classification_classes[index].objects
-    context.scene.bat_properties.current_class_is_instances = context.scene.bat_properties.classification_classes[index].is_instances
+    current = cls_list[index]
+    bat.current_class_color = current.mask_color
+    bat.current_class_objects = current.objects
+    bat.current_class_is_instances = current.is_instances
 
 
 def update_classification_class_color(self, context: Context) -> None:
@@ -51,11 +116,17 @@ def update_classification_class_color(self, context: Context) -> None:
     Args
         context: Current context
     '''
+    bat = context.scene.bat_properties
+    cls_list = bat.classification_classes
+
     # Get the index of current class
-    index = context.scene.bat_properties.classification_classes.find(context.scene.bat_properties.current_class)
+    index = _resolve_index(bat, cls_list)
 
-    # Set color of current class
-    context.scene.bat_properties.classification_classes[index].mask_color = context.scene.bat_properties.current_class_color
+    # Set color of current class (only if changed, to avoid triggering further updates)
+    entry = cls_list[index]
+    new_color = bat.current_class_color
+    if tuple(entry.mask_color) != tuple(new_color):
+        entry.mask_color = new_color
 
 
 def update_classification_class_objects(self, context: Context) -> None:
@@ -65,11 +136,17 @@ def update_classification_class_objects(self, context: Context) -> None:
     Args
         context: Current context
     '''
+    bat = context.scene.bat_properties
+    cls_list = bat.classification_classes
+
     # Get the index of current class
-    index = context.scene.bat_properties.classification_classes.find(context.scene.bat_properties.current_class)
+    index = _resolve_index(bat, cls_list)
 
-    # Set collection for current class
-    context.scene.bat_properties.classification_classes[index].objects = context.scene.bat_properties.current_class_objects
+    # Set collection for current class (only if changed, to avoid triggering further updates)
+    entry = cls_list[index]
+    new_objects = bat.current_class_objects
+    if entry.objects != new_objects:
+        entry.objects = new_objects
 
 
 def update_classification_class_is_instances(self, context: Context) -> None:
@@ -79,27 +156,54 @@ def update_classification_class_is_instances(self, context: Context) -> None:
     Args
         context: Current context
     '''
+    bat = context.scene.bat_properties
+    cls_list = bat.classification_classes
+
     # Get the index of current class
-    index = context.scene.bat_properties.classification_classes.find(context.scene.bat_properties.current_class)
+    index = _resolve_index(bat, cls_list)
 
-    # Set instance segmentation on or off for current class
-    context.scene.bat_properties.classification_classes[index].is_instances = context.scene.bat_properties.current_class_is_instances
+    # Set instance segmentation on or off for current class (only if changed, to avoid triggering further updates)
+    entry = cls_list[index]
+    new_is_instances = bat.current_class_is_instances
+    if entry.is_instances != new_is_instances:
+        entry.is_instances = new_is_instances
+
+
+def _import_camera_data() -> None:
+    '''
+    Timer function to import camera data outside of the property update callback
+
+    Returns
+        None, so the timer is only executed once
+    '''
+    bpy.ops.bat.import_camera_data()
+    return None
 
 
 def update_camera_calibration_file(self, context: Context) -> None:
     '''
     Update camera intrinsics and lens distortion parameters
+
+    The import is deferred to a timer, so multiple changes of the file path are handled by a single import
     '''
-    bpy.ops.bat.import_camera_data()
+    if not bpy.app.timers.is_registered(_import_camera_data):
+        bpy.app.timers.register(_import_camera_data, first_interval=0.0)
     
 
+# Default focal length (mm) / default sensor width (mm)
+_DEFAULT_F_RATIO = 24.0/36.0
+
+# Sentinel for ID-properties that are not set yet
+_MISSING = object()
+
 def get_sensor_width(self) -> float:
     '''
     Getter for Camera sensor_width
     '''
-    if 'sensor_width' not in self:
-        return bpy.data.cameras[bpy.context.scene.camera.data.name].sensor_width
-    return self['sensor_width']
+    v = self.get('sensor_width', _MISSING)
+    if v is _MISSING:
+        return bpy.context.scene.camera.data.sensor_width
+    return v
 
 def set_sensor_width(self, value: float) -> None:
     '''
@@ -111,9 +215,11 @@ def get_fx(self) -> float:
     '''
     Getter for Camera fx
     '''
-    if 'fx' not in self:
-        return (24/36)*bpy.context.scene.render.resolution_x  # Default focal length (mm) / sensor width (mm) * image width (pixel)
-    return self['fx']
+    v = self.get('fx', _MISSING)
+    if v is _MISSING:
+        scn_render = bpy.context.scene.render
+        return _DEFAULT_F_RATIO*scn_render.resolution_x  # Default focal length (mm) / sensor width (mm) * image width (pixel)
+    return v
 
 def set_fx(self, value: float) -> None:
     '''
@@ -126,9 +232,11 @@ def get_fy(self) -> float:
     '''
     Getter for Camera fy
     '''
-    if 'fy' not in self:
-        return (24/36)*bpy.context.scene.render.resolution_x  # Same as fx (pixel aspect = 1)
-    return self['fy']
+    v = self.get('fy', _MISSING)
+    if v is _MISSING:
+        scn_render = bpy.context.scene.render
+        return _DEFAULT_F_RATIO*scn_render.resolution_x  # Same as fx (pixel aspect = 1)
+    return v
 
 def set_fy(self, value: float) -> None:
     '''
@@ -140,9 +248,11 @@ def get_cx(self) -> float:
     '''
     Getter for Camera cx
     '''
-    if 'cx' not in self:
-        return bpy.context.scene.render.resolution_x/2
-    return self['cx']
+    v = self.get('cx', _MISSING)
+    if v is _MISSING:
+        scn_render = bpy.context.scene.render
+        return scn_render.resolution_x/2
+    return v
 
 def set_cx(self, value: float) -> None:
     '''
@@ -154,9 +264,11 @@ def get_cy(self) -> float:
     '''
     Getter for Camera cy
     '''
-    if 'cy' not in self:
-        return bpy.context.scene.render.resolution_y/2
-    return self['cy']
+    v = self.get('cy', _MISSING)
+    if v is _MISSING:
+        scn_render = bpy.context.scene.render
+        return scn_render.resolution_y/2
+    return v
 
 def set_cy(self, value: float) -> None:
     '''
@@ -351,14 +463,15 @@ class BAT_Properties(bpy.types.PropertyGroup):
 # ==============================================================================
 # Description: Make defined classes available in Blender
 
-classes = [BAT_Camera, BAT_ClassificationClass, BAT_Properties]
+classes = (BAT_Camera, BAT_ClassificationClass, BAT_Properties)
 
 def register() -> None:
     '''
     Register properties
     '''
+    reg = bpy.utils.register_class
     for cls in classes:
-        bpy.utils.register_class(cls)
+        reg(cls)
     bpy.types.Scene.bat_properties = bpy.props.PointerProperty(type=BAT_Properties)
 
 def unregister() -> None:
@@ -366,8 +479,9 @@ def unregister() -> None:
     Unregister properties
     '''
     del bpy.types.Scene.bat_properties
+    unreg = bpy.utils.unregister_class
     for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+        unreg(cls)
 
 
 if __name__ == "__main__":